@@ -17,7 +17,9 @@ import logging
 import pathlib
 import os
 import platform
+import shutil
 import sys
+import tempfile
 
 import xmlschema
 from xmlschema.cli import get_loglevel, get_converter, validate, xml2json, json2xml
@@ -44,11 +46,16 @@ class TestConsoleScripts(unittest.TestCase):
                 json2xml()
 
     def setUp(self):
+        # Work on a copy of the example, the commands write their output files in it
         vehicles_dir = pathlib.Path(__file__).parent.joinpath('test_cases/examples/vehicles/')
-        os.chdir(str(vehicles_dir))
+        self.tempdir = tempfile.TemporaryDirectory()
+        work_dir = os.path.join(self.tempdir.name, 'vehicles')
+        shutil.copytree(str(vehicles_dir), work_dir)
+        os.chdir(work_dir)
 
     def tearDown(self):
         os.chdir(WORK_DIRECTORY)
+        self.tempdir.cleanup()
 
     @patch('sys.stderr', new_callable=io.StringIO)
     @patch('sys.stdout', new_callable=io.StringIO)
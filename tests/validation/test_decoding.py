@@ -11,6 +11,7 @@
 import unittest
 import os
 import json
+import tempfile
 from decimal import Decimal
 from collections.abc import MutableMapping, MutableSequence, Set
 import base64
@@ -342,6 +343,15 @@ def iter_nested_iterables(obj):
 
 class TestDecoding(XsdValidatorTestCase):
     TEST_CASES_DIR = os.path.join(os.path.dirname(__file__), '../test_cases')
+    cache_schemas = True
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestDecoding, cls).setUpClass()
+        cls.vh_xml_tree = ElementTree.parse(cls.vh_xml_file)
+        cls.col_xml_tree = ElementTree.parse(cls.col_xml_file)
+        if lxml_etree is not None:
+            cls.vh_lxml_tree = lxml_etree.parse(cls.vh_xml_file)
 
     def check_decode(self, xsd_component, data, expected, **kwargs):
         if isinstance(expected, type) and issubclass(expected, Exception):
@@ -358,13 +368,13 @@ class TestDecoding(XsdValidatorTestCase):
 
     @unittest.skipIf(lxml_etree is None, "The lxml library is not available.")
     def test_lxml(self):
-        vh_xml_tree = lxml_etree.parse(self.vh_xml_file)
+        vh_xml_tree = self.vh_lxml_tree
         self.assertEqual(self.vh_schema.to_dict(vh_xml_tree), VEHICLES_DICT)
         self.assertEqual(xmlschema.to_dict(vh_xml_tree, self.vh_schema.url), VEHICLES_DICT)
 
     def test_to_dict_from_etree(self):
-        vh_xml_tree = ElementTree.parse(self.vh_xml_file)
-        col_xml_tree = ElementTree.parse(self.col_xml_file)
+        vh_xml_tree = self.vh_xml_tree
+        col_xml_tree = self.col_xml_tree
 
         xml_dict = self.vh_schema.to_dict(vh_xml_tree)
         self.assertNotEqual(xml_dict, VEHICLES_DICT)
@@ -493,25 +503,27 @@ class TestDecoding(XsdValidatorTestCase):
         self.assertIn("Path: /root", str(ctx.exception))
 
     def test_json_dump_and_load(self):
-        vh_xml_tree = ElementTree.parse(self.vh_xml_file)
-        col_xml_tree = ElementTree.parse(self.col_xml_file)
-        with open(self.vh_json_file, 'w') as f:
-            xmlschema.to_json(self.vh_xml_file, f)
+        vh_xml_tree = self.vh_xml_tree
+        col_xml_tree = self.col_xml_tree
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            vh_json_file = os.path.join(tempdir, 'vehicles.json')
+            with open(vh_json_file, 'w') as f:
+                xmlschema.to_json(self.vh_xml_file, f)
 
-        with open(self.vh_json_file) as f:
-            root = xmlschema.from_json(f, self.vh_schema)
+            with open(vh_json_file) as f:
+                root = xmlschema.from_json(f, self.vh_schema)
 
-        os.remove(self.vh_json_file)
-        self.check_etree_elements(vh_xml_tree.getroot(), root)
+            self.check_etree_elements(vh_xml_tree.getroot(), root)
 
-        with open(self.col_json_file, 'w') as f:
-            xmlschema.to_json(self.col_xml_file, f)
+            col_json_file = os.path.join(tempdir, 'collection.json')
+            with open(col_json_file, 'w') as f:
+                xmlschema.to_json(self.col_xml_file, f)
 
-        with open(self.col_json_file) as f:
-            root = xmlschema.from_json(f, self.col_schema)
+            with open(col_json_file) as f:
+                root = xmlschema.from_json(f, self.col_schema)
 
-        os.remove(self.col_json_file)
-        self.check_etree_elements(col_xml_tree.getroot(), root)
+            self.check_etree_elements(col_xml_tree.getroot(), root)
 
     def test_json_path_decoding(self):
         xml_file = self.col_xml_file
@@ -577,14 +589,14 @@ class TestDecoding(XsdValidatorTestCase):
         ))
 
     def test_path(self):
-        xt = ElementTree.parse(self.vh_xml_file)
+        xt = self.vh_xml_tree
         xd = self.vh_schema.to_dict(xt, '/vh:vehicles/vh:cars', namespaces=self.vh_namespaces)
         self.assertEqual(xd['vh:car'], VEHICLES_DICT['vh:cars']['vh:car'])
         xd = self.vh_schema.to_dict(xt, '/vh:vehicles/vh:bikes', namespaces=self.vh_namespaces)
         self.assertEqual(xd['vh:bike'], VEHICLES_DICT['vh:bikes']['vh:bike'])
 
     def test_max_depth_argument(self):
-        schema = self.schema_class(self.col_xsd_file)
+        schema = self.col_schema
         self.assertEqual(
             schema.decode(self.col_xml_file, max_depth=1),
             {'@xmlns:col': 'http://example.com/ns/collection',
@@ -605,7 +617,7 @@ class TestDecoding(XsdValidatorTestCase):
                         {'@id': 'b0836217463', '@available': True}]})
 
     def test_value_hook_argument(self):
-        schema = self.schema_class(self.col_xsd_file)
+        schema = self.col_schema
 
         def ascii_strings(value, xsd_type):
             try:
@@ -621,7 +633,7 @@ class TestDecoding(XsdValidatorTestCase):
         self.assertNotEqual(obj, schema.decode(self.col_xml_file))
         root = schema.encode(obj)
         self.assertIsNone(etree_elements_assert_equal(
-            root, ElementTree.parse(self.col_xml_file).getroot(), strict=False
+            root, self.col_xml_tree.getroot(), strict=False
         ))
         self.assertEqual(obj['object'][0]['title'], b'The Umbrellas')
 
@@ -32,6 +32,7 @@ from xmlschema.testing import XsdValidatorTestCase
 class TestEncoding(XsdValidatorTestCase):
 
     TEST_CASES_DIR = os.path.join(os.path.dirname(__file__), '../test_cases')
+    cache_schemas = True
 
     def check_encode(self, xsd_component, data, expected, **kwargs):
         if isinstance(expected, type) and issubclass(expected, Exception):
@@ -29,6 +29,7 @@ from xmlschema.testing import XsdValidatorTestCase
 
 class TestValidation(XsdValidatorTestCase):
     TEST_CASES_DIR = os.path.join(os.path.dirname(__file__), '../test_cases')
+    cache_schemas = True
 
     def check_validity(self, xsd_component, data, expected, use_defaults=True):
         if isinstance(expected, type) and issubclass(expected, Exception):
@@ -236,13 +236,15 @@ def etree_getpath(elem: ElementType,
 
 def etree_iter_location_hints(elem: ElementType) -> Iterator[Tuple[Any, Any]]:
     """Yields schema location hints contained in the attributes of an element."""
-    if XSI_SCHEMA_LOCATION in elem.attrib:
-        locations = elem.attrib[XSI_SCHEMA_LOCATION].split()
+    schema_locations = elem.get(XSI_SCHEMA_LOCATION)
+    if schema_locations is not None:
+        locations = schema_locations.split()
         for ns, url in zip(locations[0::2], locations[1::2]):
             yield ns, url
 
-    if XSI_NONS_SCHEMA_LOCATION in elem.attrib:
-        for url in elem.attrib[XSI_NONS_SCHEMA_LOCATION].split():
+    nons_schema_locations = elem.get(XSI_NONS_SCHEMA_LOCATION)
+    if nons_schema_locations is not None:
+        for url in nons_schema_locations.split():
             yield '', url
 
 
@@ -216,7 +216,7 @@ def make_schema_test_class(test_file, test_args, test_num, schema_class, check_w
                 self.check_xsd_file_with_lxml(xmlschema_time=time.time() - start_time)
             self.check_errors(xsd_file, expected_errors)
 
-    TestSchema.__name__ = TestSchema.__qualname__ = str('TestSchema{0:03}'.format(test_num))
+    TestSchema.__name__ = TestSchema.__qualname__ = f'TestSchema{test_num:03}'
     return TestSchema
 
 
@@ -258,6 +258,7 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
             if check_with_lxml and lxml_etree is not None:
                 cls.lxml_schema = lxml_etree.parse(source)
 
+            cls.namespaces = None
             cls.errors = []
             cls.chunks = []
             cls.longMessage = True
@@ -266,6 +267,12 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
                 print("\n##\n## Testing %r validation in debug mode.\n##" % xml_file)
                 pdb.set_trace()
 
+        def get_namespaces(self):
+            # Fetched on first use and shared by the data conversion checks
+            if TestValidator.namespaces is None:
+                TestValidator.namespaces = fetch_namespaces(xml_file)
+            return TestValidator.namespaces.copy()
+
         def check_decode_encode(self, root, converter=None, **kwargs):
             namespaces = kwargs.get('namespaces', {})
 
@@ -391,8 +398,7 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
 
             def do_decoding():
                 for obj in self.schema.iter_decode(xml_file):
-                    if isinstance(obj, (xmlschema.XMLSchemaDecodeError,
-                                        xmlschema.XMLSchemaValidationError)):
+                    if isinstance(obj, XMLSchemaValidationError):
                         self.errors.append(obj)
                     else:
                         self.chunks.append(obj)
@@ -450,8 +456,7 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
 
         def check_data_conversion_with_element_tree(self):
             root = ElementTree.parse(xml_file).getroot()
-            namespaces = fetch_namespaces(xml_file)
-            options = {'namespaces': namespaces}
+            options = {'namespaces': self.get_namespaces()}
 
             self.check_decode_encode(root, cdata_prefix='#', **options)  # Default converter
             self.check_decode_encode(root, UnorderedConverter, cdata_prefix='#', **options)
@@ -492,7 +497,7 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
 
         def check_data_conversion_with_lxml(self):
             xml_tree = lxml_etree.parse(xml_file)
-            namespaces = fetch_namespaces(xml_file)
+            namespaces = self.get_namespaces()
 
             lxml_errors = []
             lxml_decoded_chunks = []
@@ -595,7 +600,10 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
                     module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(module)
 
-                    xml_root = ElementTree.parse(os.path.join(cwd, xml_file)).getroot()
+                    # Only the root tag is needed: stop parsing at the first start event
+                    with open(os.path.join(cwd, xml_file), 'rb') as fp:
+                        for _, xml_root in ElementTree.iterparse(fp, ('start',)):
+                            break
                     bindings = [x for x in filter(lambda x: x.endswith('Binding'), dir(module))]
                     if len(bindings) == 1:
                         class_name = bindings[0]
@@ -636,5 +644,5 @@ def make_validation_test_class(test_file, test_args, test_num, schema_class, che
 
                 self.check_validation_with_generated_code()
 
-    TestValidator.__name__ = TestValidator.__qualname__ = 'TestValidator{0:03}'.format(test_num)
+    TestValidator.__name__ = TestValidator.__qualname__ = f'TestValidator{test_num:03}'
     return TestValidator
@@ -13,6 +13,7 @@ Tests subpackage module: common definitions for unittest scripts of the 'xmlsche
 import unittest
 import re
 import os
+from functools import lru_cache
 from textwrap import dedent
 
 from xmlschema.exceptions import XMLSchemaValueError
@@ -31,12 +32,23 @@ SCHEMA_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 </xs:schema>"""
 
 
+@lru_cache(maxsize=None)
+def _load_schema(schema_class, path):
+    """Builds a schema instance from a path, caching it for the next calls."""
+    return schema_class(path)
+
+
 class XsdValidatorTestCase(unittest.TestCase):
     """
     Base class for testing XSD validators.
+
+    If the class attribute `cache_schemas` is set to `True` the example schemas
+    are built once per process for each schema class and are shared with other
+    test classes that enable the option, so they have to be used as read-only.
     """
     TEST_CASES_DIR = None
     schema_class = XMLSchema10
+    cache_schemas = False
 
     @classmethod
     def setUpClass(cls):
@@ -55,21 +67,27 @@ class XsdValidatorTestCase(unittest.TestCase):
             cls.vh_xsd_file = cls.casepath('examples/vehicles/vehicles.xsd')
             cls.vh_xml_file = cls.casepath('examples/vehicles/vehicles.xml')
             cls.vh_json_file = cls.casepath('examples/vehicles/vehicles.json')
-            cls.vh_schema = cls.schema_class(cls.vh_xsd_file)
+            cls.vh_schema = cls._get_example_schema(cls.vh_xsd_file)
             cls.vh_namespaces = fetch_namespaces(cls.vh_xml_file)
 
             cls.col_dir = cls.casepath('examples/collection')
             cls.col_xsd_file = cls.casepath('examples/collection/collection.xsd')
             cls.col_xml_file = cls.casepath('examples/collection/collection.xml')
             cls.col_json_file = cls.casepath('examples/collection/collection.json')
-            cls.col_schema = cls.schema_class(cls.col_xsd_file)
+            cls.col_schema = cls._get_example_schema(cls.col_xsd_file)
             cls.col_namespaces = fetch_namespaces(cls.col_xml_file)
 
             cls.st_xsd_file = cls.casepath('features/decoder/simple-types.xsd')
-            cls.st_schema = cls.schema_class(cls.st_xsd_file)
+            cls.st_schema = cls._get_example_schema(cls.st_xsd_file)
 
             cls.models_xsd_file = cls.casepath('features/models/models.xsd')
-            cls.models_schema = cls.schema_class(cls.models_xsd_file)
+            cls.models_schema = cls._get_example_schema(cls.models_xsd_file)
+
+    @classmethod
+    def _get_example_schema(cls, path):
+        if cls.cache_schemas:
+            return _load_schema(cls.schema_class, path)
+        return cls.schema_class(path)
 
     @classmethod
     def casepath(cls, relative_path):
@@ -164,10 +182,10 @@ class XsdValidatorTestCase(unittest.TestCase):
         :param expected: the number of expected errors.
         """
         for e in self.errors:
-            error_string = str(e)
-            self.assertTrue(e.path, "Missing path for: %s" % error_string)
+            if not e.path:
+                self.fail("Missing path for: %s" % e)
             if e.namespaces:
-                self.check_namespace_prefixes(error_string)
+                self.check_namespace_prefixes(str(e))
 
         if not self.errors and expected:
             raise ValueError("{!r}: found no errors when {} expected.".format(path, expected))
@@ -180,5 +198,5 @@ class XsdValidatorTestCase(unittest.TestCase):
             else:
                 msg = "{!r}: n.{} errors expected, found {}. First five errors follow:\n\n{}"
 
-            error_string = '\n++++++++++\n\n'.join([str(e) for e in self.errors[:5]])
+            error_string = '\n++++++++++\n\n'.join(map(str, self.errors[:5]))
             raise ValueError(msg.format(path, expected, len(self.errors), error_string))
@@ -34,7 +34,11 @@ def get_test_args(args_line):
         args_line, _ = args_line.split('#', 1)  # Strip optional ending comment
     except ValueError:
         pass
-    return re.split(r'(?<!\\) ', args_line.strip())
+
+    args_line = args_line.strip()
+    if '\\' not in args_line:
+        return args_line.split(' ')  # No escaped spaces, skip the regex split
+    return re.split(r'(?<!\\) ', args_line)
 
 
 def get_test_program_args_parser(default_testfiles):
@@ -153,8 +157,12 @@ def factory_tests(test_class_builder, testfiles, suffix,
     debug_mode = False
     line_buffer = []
     test_line_parser = get_test_line_args_parser()
+    test_file_ext = '.%s' % suffix
 
     for line in fileinput.input(testfiles):
+        if fileinput.isfirstline():
+            testfiles_dir = os.path.dirname(fileinput.filename())
+
         line = line.strip()
         if not line or line[0] == '#':
             if not line_buffer:
@@ -173,17 +181,24 @@ def factory_tests(test_class_builder, testfiles, suffix,
             line = ' '.join(line_buffer)
             del line_buffer[:]
 
-        test_args = test_line_parser.parse_args(get_test_args(line))
+        # Skip files of other types before parsing the line arguments
+        line_args = get_test_args(line)
+        file_ext = os.path.splitext(line_args[0])[1].lower()
+        if file_ext and file_ext != test_file_ext and not line_args[0].startswith('-'):
+            logger.debug("Skip %s: wrong suffix.", line_args[0])
+            continue
+
+        test_args = test_line_parser.parse_args(line_args)
         if test_args.locations is not None:
             test_args.locations = {k.strip('\'"'): v for k, v in test_args.locations}
         if codegen:
             test_args.codegen = True
 
-        test_file = os.path.join(os.path.dirname(fileinput.filename()), test_args.filename)
+        test_file = os.path.join(testfiles_dir, test_args.filename)
         if os.path.isdir(test_file):
             logger.debug("Skip %s: is a directory.", test_file)
             continue
-        elif os.path.splitext(test_file)[1].lower() != '.%s' % suffix:
+        elif os.path.splitext(test_file)[1].lower() != test_file_ext:
             logger.debug("Skip %s: wrong suffix.", test_file)
             continue
         elif not os.path.isfile(test_file):